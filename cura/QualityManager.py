@@ -3,7 +3,7 @@
 
 # This collects a lot of quality and quality changes related code which was split between ContainerManager
 # and the MachineManager and really needs to usable from both.
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from UM.Application import Application
 from UM.Settings.ContainerRegistry import ContainerRegistry
@@ -69,14 +69,7 @@ class QualityManager:
     #   \param material_containers \type{List[InstanceContainer]}
     #   \return \type{List[str]}
     def findAllQualityTypesForMachineAndMaterials(self, machine_definition: "DefinitionContainerInterface", material_containers: List[InstanceContainer]) -> List[str]:
-        # Determine the common set of quality types which can be
-        # applied to all of the materials for this machine.
-        quality_type_dict = self.__fetchQualityTypeDictForMaterial(machine_definition, material_containers[0])
-        common_quality_types = set(quality_type_dict.keys())
-        for material_container in material_containers[1:]:
-            next_quality_type_dict = self.__fetchQualityTypeDictForMaterial(machine_definition, material_container)
-            common_quality_types.intersection_update(set(next_quality_type_dict.keys()))
-
+        _, common_quality_types = self.__fetchCommonQualityTypesForMaterials(machine_definition, material_containers)
         return list(common_quality_types)
 
     def findAllQualitiesForMachineAndMaterials(self, machine_definition: "DefinitionContainerInterface", material_containers: List[InstanceContainer]) -> List[InstanceContainer]:
@@ -90,6 +83,21 @@ class QualityManager:
 
         return list(qualities)
 
+    ##  Determines the common set of quality types which can be applied to all of the materials for this machine.
+    #
+    #   \param machine_definition \type{DefinitionContainer} the machine definition.
+    #   \param material_containers \type{List[InstanceContainer]} the materials.
+    #   \return \type{Tuple[Dict[str, InstanceContainer], Set[str]]} the dict of quality type names mapping to
+    #       qualities for the first material, and the set of quality types common to all materials.
+    def __fetchCommonQualityTypesForMaterials(self, machine_definition: "DefinitionContainerInterface", material_containers: List[InstanceContainer]) -> Tuple[Dict[str, InstanceContainer], Set[str]]:
+        quality_type_dict = self.__fetchQualityTypeDictForMaterial(machine_definition, material_containers[0])
+        common_quality_types = set(quality_type_dict.keys())
+        for material_container in material_containers[1:]:
+            next_quality_type_dict = self.__fetchQualityTypeDictForMaterial(machine_definition, material_container)
+            common_quality_types.intersection_update(set(next_quality_type_dict.keys()))
+
+        return quality_type_dict, common_quality_types
+
     ##  Fetches a dict of quality types names to quality profiles for a combination of machine and material.
     #
     #   \param machine_definition \type{DefinitionContainer} the machine definition.
@@ -97,10 +105,7 @@ class QualityManager:
     #   \return \type{Dict[str, InstanceContainer]} the dict of suitable quality type names mapping to qualities.
     def __fetchQualityTypeDictForMaterial(self, machine_definition: "DefinitionContainerInterface", material: InstanceContainer) -> Dict[str, InstanceContainer]:
         qualities = self.findAllQualitiesForMachineMaterial(machine_definition, material)
-        quality_type_dict = {}
-        for quality in qualities:
-            quality_type_dict[quality.getMetaDataEntry("quality_type")] = quality
-        return quality_type_dict
+        return {quality.getMetaDataEntry("quality_type"): quality for quality in qualities}
 
     ##  Find a quality container by quality type.
     #
@@ -188,14 +193,9 @@ class QualityManager:
             else:
                 materials.append(stack.material)
 
-        quality_types = self.findAllQualityTypesForMachineAndMaterials(global_machine_definition, materials)
-
-        # Map the list of quality_types to InstanceContainers
-        qualities = self.findAllQualitiesForMachineMaterial(global_machine_definition, materials[0])
-        quality_type_dict = {}
-        for quality in qualities:
-            quality_type_dict[quality.getMetaDataEntry("quality_type")] = quality
-
+        # Map the common quality types to the qualities of the first material, reusing the quality lookup for the first
+        # material instead of doing it a second time.
+        quality_type_dict, quality_types = self.__fetchCommonQualityTypesForMaterials(global_machine_definition, materials)
         return [quality_type_dict[quality_type] for quality_type in quality_types]
 
     ##  Fetch more basic versions of a material.
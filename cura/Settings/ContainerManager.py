@@ -354,10 +354,10 @@ class ContainerManager(QObject):
 
         all_stacks = self._container_registry.findContainerStacks()
         for stack in all_stacks:
-            for used_container_id in container_ids_to_check:
-                if used_container_id in [child.getId() for child in stack.getContainers()]:
-                    Logger.log("d", "The container is in use by %s", stack.getId())
-                    return True
+            stack_container_ids = {child.getId() for child in stack.getContainers()}
+            if not stack_container_ids.isdisjoint(container_ids_to_check):
+                Logger.log("d", "The container is in use by %s", stack.getId())
+                return True
         return False
 
     @pyqtSlot(str, result = str)
@@ -924,9 +924,10 @@ class ContainerManager(QObject):
             return []
 
         containers = self._container_registry.findInstanceContainersMetadata(type = "material", GUID = material_guid)
+        excluded_ids = {material_id, material_base_file}
         linked_material_names = []
         for container in containers:
-            if container["id"] in [material_id, material_base_file] or container.get("base_file") != container["id"]:
+            if container["id"] in excluded_ids or container.get("base_file") != container["id"]:
                 continue
 
             linked_material_names.append(container["name"])
@@ -84,16 +84,14 @@ class ExtruderManager(QObject):
 
         global_stack_id = Application.getInstance().getGlobalContainerStack().getId()
 
-        if global_stack_id in self._extruder_trains:
-            for position in self._extruder_trains[global_stack_id]:
-                extruder_stack_ids[position] = self._extruder_trains[global_stack_id][position].getId()
+        for position, extruder in self._extruder_trains.get(global_stack_id, {}).items():
+            extruder_stack_ids[position] = extruder.getId()
 
         return extruder_stack_ids
 
     @pyqtSlot(str, result = str)
     def getQualityChangesIdByExtruderStackId(self, extruder_stack_id: str) -> str:
-        for position in self._extruder_trains[Application.getInstance().getGlobalContainerStack().getId()]:
-            extruder = self._extruder_trains[Application.getInstance().getGlobalContainerStack().getId()][position]
+        for extruder in self._extruder_trains[Application.getInstance().getGlobalContainerStack().getId()].values():
             if extruder.getId() == extruder_stack_id:
                 return extruder.qualityChanges.getId()
 
@@ -185,22 +183,13 @@ class ExtruderManager(QObject):
         self.selectedObjectExtrudersChanged.emit()
 
     def getActiveExtruderStack(self) -> Optional["ExtruderStack"]:
-        global_container_stack = Application.getInstance().getGlobalContainerStack()
-
-        if global_container_stack:
-            if global_container_stack.getId() in self._extruder_trains:
-                if str(self._active_extruder_index) in self._extruder_trains[global_container_stack.getId()]:
-                    return self._extruder_trains[global_container_stack.getId()][str(self._active_extruder_index)]
-
-        return None
+        return self.getExtruderStack(self._active_extruder_index)
 
     ##  Get an extruder stack by index
     def getExtruderStack(self, index) -> Optional["ExtruderStack"]:
         global_container_stack = Application.getInstance().getGlobalContainerStack()
         if global_container_stack:
-            if global_container_stack.getId() in self._extruder_trains:
-                if str(index) in self._extruder_trains[global_container_stack.getId()]:
-                    return self._extruder_trains[global_container_stack.getId()][str(index)]
+            return self._extruder_trains.get(global_container_stack.getId(), {}).get(str(index))
         return None
 
     ##  Get all extruder stacks
@@ -337,9 +326,7 @@ class ExtruderManager(QObject):
     #
     #   \param machine_id The machine to get the extruders of.
     def getMachineExtruders(self, machine_id: str):
-        if machine_id not in self._extruder_trains:
-            return []
-        return [self._extruder_trains[machine_id][name] for name in self._extruder_trains[machine_id]]
+        return list(self._extruder_trains.get(machine_id, {}).values())
 
     ##  Returns a list containing the global stack and active extruder stacks.
     #
@@ -362,10 +349,8 @@ class ExtruderManager(QObject):
         if not global_stack:
             return None
 
-        result = []
-        if global_stack.getId() in self._extruder_trains:
-            for extruder in sorted(self._extruder_trains[global_stack.getId()]):
-                result.append(self._extruder_trains[global_stack.getId()][extruder])
+        extruder_trains = self._extruder_trains.get(global_stack.getId(), {})
+        result = [extruder_trains[position] for position in sorted(extruder_trains)]
 
         machine_extruder_count = global_stack.getProperty("machine_extruder_count", "value")
 
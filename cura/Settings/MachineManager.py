@@ -4,7 +4,7 @@
 import collections
 import time
 #Type hinting.
-from typing import Union, List, Dict, TYPE_CHECKING, Optional
+from typing import Any, Union, List, Dict, TYPE_CHECKING, Optional
 
 from UM.Scene.Iterator.DepthFirstIterator import DepthFirstIterator
 from UM.Signal import Signal
@@ -194,16 +194,21 @@ class MachineManager(QObject):
         extruders = sorted(ExtruderManager.getInstance().getMachineExtruders(machine_id),
                            key=lambda k: k.getMetaDataEntry("position"))
 
+        # Map the names of all variants of this machine to their IDs at once, rather than querying the registry for
+        # every extruder separately.
+        variant_ids_by_name = {}  # type: Dict[str, str]
+        variants_metadata = ContainerRegistry.getInstance().findInstanceContainersMetadata(type = "variant",
+                                                                                          definition = self._global_container_stack.definition.getId())
+        for variant_metadata in variants_metadata:
+            variant_ids_by_name.setdefault(variant_metadata.get("name"), variant_metadata["id"])
+
         for extruder_model, extruder in zip(active_printer_model.extruders, extruders):
-            containers = ContainerRegistry.getInstance().findInstanceContainersMetadata(type="variant",
-                                                                                        definition=self._global_container_stack.definition.getId(),
-                                                                                        name=extruder_model.hotendID)
-            if containers:
+            variant_id = variant_ids_by_name.get(extruder_model.hotendID)
+            if variant_id is not None:
                 # The hotend ID is known.
-                machine_id = self.activeMachineId
                 if extruder.variant.getName() != extruder_model.hotendID:
                     change_found = True
-                    self._auto_hotends_changed[extruder.getMetaDataEntry("position")] = containers[0]["id"]
+                    self._auto_hotends_changed[extruder.getMetaDataEntry("position")] = variant_id
 
         if change_found:
             # A change was found, let the output device handle this.
@@ -222,12 +227,24 @@ class MachineManager(QObject):
         extruders = sorted(ExtruderManager.getInstance().getMachineExtruders(machine_id),
                            key=lambda k: k.getMetaDataEntry("position"))
 
+        # Fetch the materials for all extruders in one registry query and group them by GUID, instead of running a
+        # separate query for every extruder.
+        material_guids = {extruder_model.activeMaterial.guid
+                          for extruder_model in active_printer_model.extruders
+                          if extruder_model.activeMaterial is not None}
+        materials_by_guid = {}  # type: Dict[str, List[Dict[str, Any]]]
+        if material_guids:
+            materials_metadata = ContainerRegistry.getInstance().findInstanceContainersMetadata(type = "material",
+                                                                                               definition = self._global_container_stack.definition.getId())
+            for material_metadata in materials_metadata:
+                guid = material_metadata.get("GUID")
+                if guid in material_guids:
+                    materials_by_guid.setdefault(guid, []).append(material_metadata)
+
         for extruder_model, extruder in zip(active_printer_model.extruders, extruders):
             if extruder_model.activeMaterial is None:
                 continue
-            containers = ContainerRegistry.getInstance().findInstanceContainersMetadata(type="material",
-                                                                                        definition=self._global_container_stack.definition.getId(),
-                                                                                        GUID=extruder_model.activeMaterial.guid)
+            containers = materials_by_guid.get(extruder_model.activeMaterial.guid)
             if containers:
                 # The material is known.
                 if extruder.material.getMetaDataEntry("GUID") != extruder_model.activeMaterial.guid:
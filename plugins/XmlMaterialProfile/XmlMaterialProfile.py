@@ -495,7 +495,7 @@ class XmlMaterialProfile(InstanceContainer):
             if tag_name in self.__material_properties_setting_map:
                 common_setting_values[self.__material_properties_setting_map[tag_name]] = entry.text
 
-        meta_data["approximate_diameter"] = str(round(float(property_values.get("diameter", 2.85)))) # In mm
+        meta_data["approximate_diameter"] = _approximateDiameter(property_values.get("diameter", 2.85)) # In mm
         meta_data["properties"] = property_values
         meta_data["definition"] = "fdmprinter"
 
@@ -690,6 +690,10 @@ class XmlMaterialProfile(InstanceContainer):
         #Update the serialized data to the latest version.
         serialized = cls._updateSerialized(serialized)
 
+        #This is run for every material profile at start-up, so keep frequently used objects in local variables.
+        registry = ContainerRegistry.getInstance()
+        namespaces = cls.__namespaces
+
         base_metadata = {
             "type": "material",
             "status": "unknown", #TODO: Add material verification.
@@ -711,22 +715,22 @@ class XmlMaterialProfile(InstanceContainer):
         else:
             base_metadata["setting_version"] = cls.xmlVersionToSettingVersion("1.2") #1.2 and lower didn't have that version number there yet.
 
-        for entry in data.iterfind("./um:metadata/*", cls.__namespaces):
+        for entry in data.iterfind("./um:metadata/*", namespaces):
             tag_name = _tag_without_namespace(entry)
 
             if tag_name == "name":
-                brand = entry.find("./um:brand", cls.__namespaces)
-                material = entry.find("./um:material", cls.__namespaces)
-                color = entry.find("./um:color", cls.__namespaces)
-                label = entry.find("./um:label", cls.__namespaces)
+                brand = entry.find("./um:brand", namespaces)
+                material = entry.find("./um:material", namespaces)
+                color = entry.find("./um:color", namespaces)
+                label = entry.find("./um:label", namespaces)
 
                 if label is not None:
                     base_metadata["name"] = label.text
                 else:
                     base_metadata["name"] = cls._profile_name(material.text, color.text)
-                base_metadata["brand"] = brand.text
-                base_metadata["material"] = material.text
-                base_metadata["color_name"] = color.text
+                base_metadata["brand"] = _internText(brand.text)
+                base_metadata["material"] = _internText(material.text)
+                base_metadata["color_name"] = _internText(color.text)
                 continue
 
             #Setting_version is derived from the "version" tag in the schema earlier, so don't set it here.
@@ -741,16 +745,16 @@ class XmlMaterialProfile(InstanceContainer):
             base_metadata["adhesion_info"] = ""
 
         property_values = {}
-        properties = data.iterfind("./um:properties/*", cls.__namespaces)
+        properties = data.iterfind("./um:properties/*", namespaces)
         for entry in properties:
             tag_name = _tag_without_namespace(entry)
-            property_values[tag_name] = entry.text
+            property_values[tag_name] = _internText(entry.text)
 
-        base_metadata["approximate_diameter"] = str(round(float(property_values.get("diameter", 2.85)))) # In mm
+        base_metadata["approximate_diameter"] = _approximateDiameter(property_values.get("diameter", 2.85)) # In mm
         base_metadata["properties"] = property_values
         base_metadata["definition"] = "fdmprinter"
 
-        compatible_entries = data.iterfind("./um:settings/um:setting[@key='hardware compatible']", cls.__namespaces)
+        compatible_entries = data.iterfind("./um:settings/um:setting[@key='hardware compatible']", namespaces)
         try:
             common_compatibility = cls._parseCompatibleValue(next(compatible_entries).text)
         except StopIteration: #No 'hardware compatible' setting.
@@ -761,26 +765,26 @@ class XmlMaterialProfile(InstanceContainer):
         # Map machine human-readable names to IDs
         product_id_map = cls.getProductIdMap()
 
-        for machine in data.iterfind("./um:settings/um:machine", cls.__namespaces):
+        for machine in data.iterfind("./um:settings/um:machine", namespaces):
             machine_compatibility = common_compatibility
-            for entry in machine.iterfind("./um:setting", cls.__namespaces):
+            for entry in machine.iterfind("./um:setting", namespaces):
                 key = entry.get("key")
                 if key == "hardware compatible":
                     machine_compatibility = cls._parseCompatibleValue(entry.text)
 
-            for identifier in machine.iterfind("./um:machine_identifier", cls.__namespaces):
+            for identifier in machine.iterfind("./um:machine_identifier", namespaces):
                 machine_id_list = product_id_map.get(identifier.get("product"), [])
                 if not machine_id_list:
                     machine_id_list = cls.getPossibleDefinitionIDsFromName(identifier.get("product"))
 
                 for machine_id in machine_id_list:
-                    definition_metadata = ContainerRegistry.getInstance().findDefinitionContainersMetadata(id = machine_id)
+                    definition_metadata = registry.findDefinitionContainersMetadata(id = machine_id)
                     if not definition_metadata:
                         continue
 
                     definition_metadata = definition_metadata[0]
 
-                    machine_manufacturer = identifier.get("manufacturer", definition_metadata.get("manufacturer", "Unknown")) #If the XML material doesn't specify a manufacturer, use the one in the actual printer definition.
+                    machine_manufacturer = _internText(identifier.get("manufacturer", definition_metadata.get("manufacturer", "Unknown"))) #If the XML material doesn't specify a manufacturer, use the one in the actual printer definition.
 
                     if machine_compatibility:
                         new_material_id = container_id + "_" + machine_id
@@ -789,7 +793,7 @@ class XmlMaterialProfile(InstanceContainer):
                         # project file and the a material in Cura have the same ID.
                         # In the case if a derived material already exists, override that material container because if
                         # the data in the parent material has been changed, the derived ones should be updated too.
-                        found_materials = ContainerRegistry.getInstance().findInstanceContainersMetadata(id = new_material_id)
+                        found_materials = registry.findInstanceContainersMetadata(id = new_material_id)
                         if found_materials:
                             new_material_metadata = found_materials[0]
                         else:
@@ -804,7 +808,7 @@ class XmlMaterialProfile(InstanceContainer):
                         if len(found_materials) == 0: #This is a new material.
                             result_metadata.append(new_material_metadata)
 
-                    buildplates = machine.iterfind("./um:buildplate", cls.__namespaces)
+                    buildplates = machine.iterfind("./um:buildplate", namespaces)
                     buildplate_map = {}
                     buildplate_map["buildplate_compatible"] = {}
                     buildplate_map["buildplate_recommended"] = {}
@@ -813,15 +817,17 @@ class XmlMaterialProfile(InstanceContainer):
                         if buildplate_id is None:
                             continue
 
-                        variant_containers = ContainerRegistry.getInstance().findInstanceContainersMetadata(id = buildplate_id)
+                        variant_containers = registry.findInstanceContainersMetadata(id = buildplate_id)
                         if not variant_containers:
                             # It is not really properly defined what "ID" is so also search for variants by name.
-                            variant_containers = ContainerRegistry.getInstance().findInstanceContainersMetadata(definition = machine_id, name = buildplate_id)
+                            variant_containers = registry.findInstanceContainersMetadata(definition = machine_id, name = buildplate_id)
 
                         if not variant_containers:
                             continue
 
-                        settings = buildplate.iterfind("./um:setting", cls.__namespaces)
+                        buildplate_compatibility = machine_compatibility
+                        buildplate_recommended = machine_compatibility
+                        settings = buildplate.iterfind("./um:setting", namespaces)
                         for entry in settings:
                             key = entry.get("key")
                             if key == "hardware compatible":
@@ -829,21 +835,21 @@ class XmlMaterialProfile(InstanceContainer):
                             elif key == "hardware recommended":
                                 buildplate_recommended = cls._parseCompatibleValue(entry.text)
 
-                        buildplate_map["buildplate_compatible"][buildplate_id] = buildplate_map["buildplate_compatible"]
-                        buildplate_map["buildplate_recommended"][buildplate_id] = buildplate_map["buildplate_recommended"]
+                        buildplate_map["buildplate_compatible"][buildplate_id] = buildplate_compatibility
+                        buildplate_map["buildplate_recommended"][buildplate_id] = buildplate_recommended
 
-                    for hotend in machine.iterfind("./um:hotend", cls.__namespaces):
+                    for hotend in machine.iterfind("./um:hotend", namespaces):
                         hotend_id = hotend.get("id")
                         if hotend_id is None:
                             continue
 
-                        variant_containers = ContainerRegistry.getInstance().findInstanceContainersMetadata(id = hotend_id)
+                        variant_containers = registry.findInstanceContainersMetadata(id = hotend_id)
                         if not variant_containers:
                             # It is not really properly defined what "ID" is so also search for variants by name.
-                            variant_containers = ContainerRegistry.getInstance().findInstanceContainersMetadata(definition = machine_id, name = hotend_id)
+                            variant_containers = registry.findInstanceContainersMetadata(definition = machine_id, name = hotend_id)
 
                         hotend_compatibility = machine_compatibility
-                        for entry in hotend.iterfind("./um:setting", cls.__namespaces):
+                        for entry in hotend.iterfind("./um:setting", namespaces):
                             key = entry.get("key")
                             if key == "hardware compatible":
                                 hotend_compatibility = cls._parseCompatibleValue(entry.text)
@@ -851,7 +857,7 @@ class XmlMaterialProfile(InstanceContainer):
                         new_hotend_id = container_id + "_" + machine_id + "_" + hotend_id.replace(" ", "_")
 
                         # Same as machine compatibility, keep the derived material containers consistent with the parent material
-                        found_materials = ContainerRegistry.getInstance().findInstanceContainersMetadata(id = new_hotend_id)
+                        found_materials = registry.findInstanceContainersMetadata(id = new_hotend_id)
                         if found_materials:
                             new_hotend_material_metadata = found_materials[0]
                         else:
@@ -924,14 +930,19 @@ class XmlMaterialProfile(InstanceContainer):
     ##  Gets a mapping from product names in the XML files to their definition
     #   IDs.
     #
-    #   This loads the mapping from a file.
+    #   This loads the mapping from a file the first time it is requested. The
+    #   file doesn't change while Cura is running, so the result is cached for
+    #   all subsequent material profiles that get loaded.
     @classmethod
     def getProductIdMap(cls) -> Dict[str, List[str]]:
-        product_to_id_file = os.path.join(os.path.dirname(sys.modules[cls.__module__].__file__), "product_to_id.json")
-        with open(product_to_id_file) as f:
-            product_to_id_map = json.load(f)
-        product_to_id_map = {key: [value] for key, value in product_to_id_map.items()}
-        return product_to_id_map
+        if XmlMaterialProfile.__product_to_id_map is None:
+            product_to_id_file = os.path.join(os.path.dirname(sys.modules[cls.__module__].__file__), "product_to_id.json")
+            with open(product_to_id_file) as f:
+                product_to_id_map = json.load(f)
+            XmlMaterialProfile.__product_to_id_map = {key: [value] for key, value in product_to_id_map.items()}
+        return XmlMaterialProfile.__product_to_id_map
+
+    __product_to_id_map = None  # type: Optional[Dict[str, List[str]]]
 
     ##  Parse the value of the "material compatible" property.
     @classmethod
@@ -954,10 +965,10 @@ class XmlMaterialProfile(InstanceContainer):
         "adhesion tendency": "material_adhesion_tendency",
         "surface energy": "material_surface_energy"
     }
-    __unmapped_settings = [
+    __unmapped_settings = frozenset([
         "hardware compatible",
         "hardware recommended"
-    ]
+    ])
     __material_properties_setting_map = {
         "diameter": "material_diameter"
     }
@@ -993,6 +1004,25 @@ def _indent(elem, level = 0):
 def _tag_without_namespace(element):
     return element.tag[element.tag.rfind("}") + 1:]
 
+# Brands, material types, colours, manufacturers and property values are
+# repeated across hundreds of material profiles. Interning them lets all
+# metadata dicts share a single string object per distinct value.
+def _internText(text: Optional[str]) -> Optional[str]:
+    if text is None:
+        return None
+    return sys.intern(text)
+
+# Only a handful of different diameters exist among all material profiles, so
+# the rounded string representation is cached per diameter value. The cached
+# strings are interned so that all metadata dicts share the same objects.
+_approximate_diameters = {}  # type: Dict[Any, str]
+def _approximateDiameter(diameter) -> str:
+    approximate_diameter = _approximate_diameters.get(diameter)
+    if approximate_diameter is None:
+        approximate_diameter = sys.intern(str(round(float(diameter))))
+        _approximate_diameters[diameter] = approximate_diameter
+    return approximate_diameter
+
 #While loading XML profiles, some of these profiles don't know what variant
 #they belong to. We'd like to search by the machine ID and the variant's
 #name, but we don't know the variant's ID. Not all variants have been loaded
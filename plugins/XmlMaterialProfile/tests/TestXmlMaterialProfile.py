@@ -0,0 +1,84 @@
+# Copyright (c) 2017 Ultimaker B.V.
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import pytest #To register tests with.
+import unittest.mock #To mock the container registry.
+
+from plugins.XmlMaterialProfile.XmlMaterialProfile import XmlMaterialProfile #The class we're testing.
+
+##  A material profile for the Ultimaker 3 with one hotend and two buildplates,
+#   one of which has no settings of its own.
+test_material_xml = """<?xml version="1.0" encoding="UTF-8"?>
+<fdmmaterial xmlns="http://www.ultimaker.com/material" version="1.3">
+    <metadata>
+        <name>
+            <brand>Generic</brand>
+            <material>PLA</material>
+            <color>Generic</color>
+        </name>
+        <GUID>506c9f0d-e3aa-4bd4-b2d2-23e2425b1aa9</GUID>
+        <version>1</version>
+    </metadata>
+    <properties>
+        <diameter>2.85</diameter>
+    </properties>
+    <settings>
+        <machine>
+            <machine_identifier manufacturer="Ultimaker B.V." product="Ultimaker 3" />
+            <setting key="hardware compatible">{machine_compatible}</setting>
+            <buildplate id="glass">
+                <setting key="hardware compatible">{glass_compatible}</setting>
+            </buildplate>
+            <buildplate id="aluminum" />
+            <hotend id="AA 0.4" />
+        </machine>
+    </settings>
+</fdmmaterial>
+"""
+
+##  Gives a mocked container registry that knows the Ultimaker 3 definition,
+#   its buildplates and its hotend, but no materials.
+@pytest.fixture()
+def container_registry():
+    known_variant_ids = {"glass", "aluminum", "AA 0.4"}
+
+    def findInstanceContainersMetadata(**kwargs):
+        if kwargs.get("id") in known_variant_ids:
+            return [{"id": kwargs["id"]}]
+        return []
+
+    registry = unittest.mock.MagicMock()
+    registry.findDefinitionContainersMetadata = unittest.mock.MagicMock(side_effect = lambda **kwargs: [{"id": kwargs["id"], "manufacturer": "Ultimaker B.V."}])
+    registry.findInstanceContainersMetadata = unittest.mock.MagicMock(side_effect = findInstanceContainersMetadata)
+    return registry
+
+##  Deserializes the metadata of the test material and returns the metadata of
+#   the hotend-specific material, which holds the buildplate compatibility.
+def deserializeHotendMetadata(container_registry, machine_compatible, glass_compatible):
+    serialized = test_material_xml.format(machine_compatible = machine_compatible, glass_compatible = glass_compatible)
+    with unittest.mock.patch("UM.Settings.ContainerRegistry.ContainerRegistry.getInstance", unittest.mock.MagicMock(return_value = container_registry)):
+        with unittest.mock.patch.object(XmlMaterialProfile, "_updateSerialized", lambda serialized: serialized):
+            result = XmlMaterialProfile.deserializeMetadata(serialized, "generic_pla")
+
+    hotend_metadata = [metadata for metadata in result if metadata["id"] == "generic_pla_ultimaker3_AA_0.4"]
+    assert len(hotend_metadata) == 1
+    return hotend_metadata[0]
+
+##  Tests whether the compatibility setting of a buildplate ends up in the
+#   metadata as the parsed value.
+@pytest.mark.parametrize("glass_compatible, expected", [("no", False), ("yes", True)])
+def test_deserializeMetadataBuildplateCompatibility(container_registry, glass_compatible, expected):
+    metadata = deserializeHotendMetadata(container_registry, "yes", glass_compatible)
+
+    assert metadata["buildplate_compatible"]["glass"] is expected
+    assert metadata["buildplate_recommended"]["glass"] is True #Not specified, so falls back to the machine compatibility.
+
+##  Tests whether a buildplate without settings falls back to the
+#   compatibility of the machine.
+@pytest.mark.parametrize("machine_compatible, expected", [("yes", True), ("no", False)])
+def test_deserializeMetadataBuildplateFallback(container_registry, machine_compatible, expected):
+    metadata = deserializeHotendMetadata(container_registry, machine_compatible, "no")
+
+    assert metadata["buildplate_compatible"]["glass"] is False
+    assert metadata["buildplate_compatible"]["aluminum"] is expected
+    assert metadata["buildplate_recommended"]["aluminum"] is expected